@@ -59,6 +59,9 @@ class nwConst:
     # Dialogs
     DLG_FINISHED = 2
 
+    # File I/O
+    IO_BUFFER = 262144  # bytes
+
 # END Class nwConst
 
 
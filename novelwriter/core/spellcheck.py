@@ -24,12 +24,13 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import sys
 import json
 import logging
 
 from typing import TYPE_CHECKING
 from pathlib import Path
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from PyQt5.QtCore import QLocale
 
@@ -213,6 +214,11 @@ class UserDictionary:
         self._words.add(word)
         return True
 
+    def replace(self, words: Iterable[str]) -> None:
+        """Replace the content of the dictionary."""
+        self._words = set(words)
+        return
+
     def load(self) -> None:
         """Load the user's dictionary."""
         self._words = set()
@@ -221,7 +227,10 @@ class UserDictionary:
             try:
                 with open(wordList, mode="r", encoding="utf-8") as fObj:
                     data = json.load(fObj)
-                self._words = set(data.get("novelWriter.userDict", []))
+                self._words = {
+                    sys.intern(w) for w in data.get("novelWriter.userDict", [])
+                    if isinstance(w, str)
+                }
                 logger.info("Loaded: %s", nwFiles.DICT_FILE)
             except Exception:
                 logger.error("Failed to load user dictionary")
@@ -23,20 +23,24 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import sys
+import bisect
 import logging
 
 from typing import TYPE_CHECKING
 from pathlib import Path
+from collections.abc import Iterator
 
 from PyQt5.QtGui import QCloseEvent
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QStringListModel, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QAbstractItemView, QDialog, QDialogButtonBox, QFileDialog, QHBoxLayout,
-    QLineEdit, QListWidget, QPushButton, QVBoxLayout, qApp
+    QLineEdit, QListView, QPushButton, QVBoxLayout
 )
 
 from novelwriter import CONFIG, SHARED
 from novelwriter.common import formatFileFilter
+from novelwriter.constants import nwConst
 from novelwriter.core.spellcheck import UserDictionary
 from novelwriter.extensions.configlayout import NColourLabel
 
@@ -88,10 +92,13 @@ class GuiWordList(QDialog):
         self.headerBox.addWidget(self.exportButton, 0)
 
         # List Box
-        self.listBox = QListWidget(self)
+        self._model = QStringListModel(self)
+
+        self.listBox = QListView(self)
+        self.listBox.setModel(self._model)
         self.listBox.setDragDropMode(QAbstractItemView.NoDragDrop)
+        self.listBox.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.listBox.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.listBox.setSortingEnabled(True)
 
         # Add/Remove Form
         self.newEntry = QLineEdit(self)
@@ -123,6 +130,9 @@ class GuiWordList(QDialog):
 
         self.setLayout(self.outerBox)
 
+        self._userDict = UserDictionary(SHARED.project)
+        self._words: set[str] = set()
+        self._list: list[str] = []
         self._loadWordList()
 
         logger.debug("Ready: GuiWordList")
@@ -153,29 +163,38 @@ class GuiWordList(QDialog):
         """Add a new word to the word list."""
         word = self.newEntry.text().strip()
         self.newEntry.setText("")
-        self.listBox.clearSelection()
-        self._addWord(word)
-        if items := self.listBox.findItems(word, Qt.MatchExactly):
-            self.listBox.setCurrentItem(items[0])
-            self.listBox.scrollToItem(items[0], QAbstractItemView.ScrollHint.PositionAtCenter)
+        if (row := self._addWord(word)) is not None:
+            index = self._model.index(row)
+            self.listBox.clearSelection()
+            self.listBox.setCurrentIndex(index)
+            self.listBox.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+        elif word in self._words:
+            # Already in the list, so just scroll to it
+            index = self._model.index(bisect.bisect_left(self._list, word))
+            self.listBox.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
         return
 
     @pyqtSlot()
     def _doDelete(self) -> None:
         """Delete the selected items."""
-        for item in self.listBox.selectedItems():
-            self.listBox.takeItem(self.listBox.row(item))
+        ranges: list[list[int]] = []
+        for row in sorted({index.row() for index in self.listBox.selectedIndexes()}):
+            if ranges and ranges[-1][1] == row:
+                ranges[-1][1] = row + 1
+            else:
+                ranges.append([row, row + 1])
+        for first, last in reversed(ranges):
+            self._words.difference_update(self._list[first:last])
+            del self._list[first:last]
+            self._model.removeRows(first, last - first)
         return
 
     @pyqtSlot()
     def _doSave(self) -> None:
         """Save the new word list and close."""
-        userDict = UserDictionary(SHARED.project)
-        for word in self._listWords():
-            userDict.add(word)
-        userDict.save()
+        self._userDict.replace(self._words)
+        self._userDict.save()
         self.newWordListReady.emit()
-        qApp.processEvents()
         self.close()
         return
 
@@ -187,30 +206,33 @@ class GuiWordList(QDialog):
         ))
         ffilter = formatFileFilter(["*.txt", "*"])
         path, _ = QFileDialog.getOpenFileName(
-            self, self.tr("Import File"), str(Path.home()), filter=ffilter
+            self, self.tr("Import File"), str(CONFIG.lastPath()), filter=ffilter
         )
         if path:
+            CONFIG.setLastPath(path)
             try:
-                with open(path, mode="r", encoding="utf-8") as fo:
-                    words = set(w.strip() for w in fo.read().split())
+                with open(path, mode="rb", buffering=nwConst.IO_BUFFER) as fo:
+                    data = fo.read()
+                text = data.decode("ascii") if data.isascii() else data.decode("utf-8")
+                words = set(map(sys.intern, text.split()))
             except Exception as exc:
                 SHARED.error("Could not read file.", exc=exc)
                 return
-            for word in words:
-                self._addWord(word)
+            self._addWords(words)
         return
 
     @pyqtSlot()
     def _exportWords(self) -> None:
         """Export words to file."""
         path, _ = QFileDialog.getSaveFileName(
-            self, self.tr("Export File"), str(Path.home())
+            self, self.tr("Export File"), str(CONFIG.lastPath())
         )
         if path:
+            CONFIG.setLastPath(path)
             try:
                 path = Path(path).with_suffix(".txt")
-                with open(path, mode="w", encoding="utf-8") as fo:
-                    fo.write("\n".join(self._listWords()))
+                with open(path, mode="w", encoding="utf-8", buffering=nwConst.IO_BUFFER) as fo:
+                    fo.writelines(f"{word}\n" for word in self._iterWords())
             except Exception as exc:
                 SHARED.error("Could not write file.", exc=exc)
         return
@@ -221,11 +243,10 @@ class GuiWordList(QDialog):
 
     def _loadWordList(self) -> None:
         """Load the project's word list, if it exists."""
-        userDict = UserDictionary(SHARED.project)
-        userDict.load()
-        self.listBox.clear()
-        for word in userDict:
-            self.listBox.addItem(word)
+        self._userDict.load()
+        self._words = {word for w in self._userDict if (word := w.strip())}
+        self._list = sorted(self._words)
+        self._model.setStringList(self._list)
         return
 
     def _saveGuiSettings(self) -> None:
@@ -240,19 +261,34 @@ class GuiWordList(QDialog):
 
         return
 
-    def _addWord(self, word: str) -> None:
-        """Add a single word to the list."""
-        if word and not self.listBox.findItems(word, Qt.MatchExactly):
-            self.listBox.addItem(word)
-            self._changed = True
+    def _addWord(self, word: str) -> int | None:
+        """Add a single word to the list, and return its row. If the
+        word is blank or already in the list, None is returned.
+        """
+        if not word or word in self._words:
+            return None
+        word = sys.intern(word)
+        row = bisect.bisect_left(self._list, word)
+        self._words.add(word)
+        self._list.insert(row, word)
+        self._model.insertRow(row)
+        self._model.setData(self._model.index(row), word)
+        self._changed = True
+        return row
+
+    def _addWords(self, words: set[str]) -> None:
+        """Add a batch of words to the list. Only words not already in
+        the list are merged in, and the model is only updated once.
+        """
+        if new := words - self._words:
+            self._words |= new
+            self._list.extend(sorted(new))
+            self._list.sort()
+            self._model.setStringList(self._list)
         return
 
-    def _listWords(self) -> list[str]:
-        """List all words in the list box."""
-        result = []
-        for i in range(self.listBox.count()):
-            if (item := self.listBox.item(i)) and (word := item.text().strip()):
-                result.append(word)
-        return result
+    def _iterWords(self) -> Iterator[str]:
+        """Iterate over all words in the sorted word list."""
+        return iter(self._list)
 
 # END Class GuiWordList
@@ -58,6 +58,12 @@ def testCoreSpell_UserDictionary(monkeypatch, mockGUI, fncPath):
     # Check the iterator
     assert sorted(userDict) == ["bar", "foo"]
 
+    # Replace the content
+    userDict.replace(["baz", "foo"])
+    assert sorted(userDict) == ["baz", "foo"]
+    userDict.replace(["bar", "foo"])
+    assert sorted(userDict) == ["bar", "foo"]
+
     # Save the file, but fail
     with monkeypatch.context() as mp:
         mp.setattr("builtins.open", causeOSError)
@@ -102,6 +108,11 @@ def testCoreSpell_UserDictionary(monkeypatch, mockGUI, fncPath):
     userDict.load()
     assert sorted(userDict) == ["bar", "foo"]
 
+    # Entries that are not strings are skipped
+    dictFile.write_text('{"novelWriter.userDict": ["foo", 42, null, "bar"]}')
+    userDict.load()
+    assert sorted(userDict) == ["bar", "foo"]
+
 # END Test testCoreSpell_UserDictionary
 
 
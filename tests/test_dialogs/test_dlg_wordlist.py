@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import pytest
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QItemSelectionModel
 from PyQt5.QtWidgets import QDialog, QAction, QFileDialog
 
 from tools import buildTestProject
@@ -54,7 +54,7 @@ def testDlgWordList_Dialog(qtbot, monkeypatch, nwGUI, fncPath, projPath):
     wList.show()
 
     # List should be blank
-    assert wList.listBox.count() == 0
+    assert wList._model.rowCount() == 0
 
     # Add words
     userDict = UserDictionary(SHARED.project)
@@ -68,47 +68,65 @@ def testDlgWordList_Dialog(qtbot, monkeypatch, nwGUI, fncPath, projPath):
     wList._loadWordList()
 
     # Check that the content was loaded
-    assert wList.listBox.item(0).text() == "word_a"  # type: ignore
-    assert wList.listBox.item(1).text() == "word_b"  # type: ignore
-    assert wList.listBox.item(2).text() == "word_c"  # type: ignore
-    assert wList.listBox.item(3).text() == "word_f"  # type: ignore
-    assert wList.listBox.item(4).text() == "word_g"  # type: ignore
-    assert wList.listBox.count() == 5
+    assert wList._model.index(0).data() == "word_a"
+    assert wList._model.index(1).data() == "word_b"
+    assert wList._model.index(2).data() == "word_c"
+    assert wList._model.index(3).data() == "word_f"
+    assert wList._model.index(4).data() == "word_g"
+    assert wList._model.rowCount() == 5
 
     # Add a blank word, which is ignored
     wList.newEntry.setText("   ")
     wList._doAdd()
-    assert wList.listBox.count() == 5
+    assert wList._model.rowCount() == 5
 
-    # Add an existing word, which is ignored
+    # Add an existing word, which is ignored, and the selection is kept
+    wList.listBox.selectionModel().select(wList._model.index(0), QItemSelectionModel.Select)
+    selected = wList.listBox.selectionModel().selectedIndexes()
+    assert [index.row() for index in selected] == [0]
     wList.newEntry.setText("word_c")
     wList._doAdd()
-    assert wList.listBox.count() == 5
+    assert wList._model.rowCount() == 5
+    assert wList.listBox.selectionModel().selectedIndexes() == selected
 
     # Add a new word
     wList.newEntry.setText("word_d")
     wList._doAdd()
-    assert wList.listBox.count() == 6
+    assert wList._model.rowCount() == 6
 
     # Check that the content now
-    assert wList.listBox.item(0).text() == "word_a"  # type: ignore
-    assert wList.listBox.item(1).text() == "word_b"  # type: ignore
-    assert wList.listBox.item(2).text() == "word_c"  # type: ignore
-    assert wList.listBox.item(3).text() == "word_d"  # type: ignore
-    assert wList.listBox.item(4).text() == "word_f"  # type: ignore
-    assert wList.listBox.item(5).text() == "word_g"  # type: ignore
+    assert wList._model.index(0).data() == "word_a"
+    assert wList._model.index(1).data() == "word_b"
+    assert wList._model.index(2).data() == "word_c"
+    assert wList._model.index(3).data() == "word_d"
+    assert wList._model.index(4).data() == "word_f"
+    assert wList._model.index(5).data() == "word_g"
 
     # Delete a word
     wList.newEntry.setText("delete_me")
     wList._doAdd()
-    assert wList.listBox.item(0).text() == "delete_me"  # type: ignore
+    assert wList._model.index(0).data() == "delete_me"
 
-    delItem = wList.listBox.findItems("delete_me", Qt.MatchExactly)[0]
-    assert delItem.text() == "delete_me"
-    delItem.setSelected(True)
+    delIndex = wList._model.index(0)
+    assert delIndex.data() == "delete_me"
+    wList.listBox.selectionModel().select(delIndex, QItemSelectionModel.Select)
     wList._doDelete()
-    assert wList.listBox.findItems("delete_me", Qt.MatchExactly) == []
-    assert wList.listBox.item(0).text() == "word_a"  # type: ignore
+    assert "delete_me" not in wList._model.stringList()
+    assert wList._model.index(0).data() == "word_a"
+
+    # Delete multiple ranges
+    for word in ("del_a", "word_y", "word_z"):
+        wList.newEntry.setText(word)
+        wList._doAdd()
+    assert wList._model.rowCount() == 9
+
+    wList.listBox.clearSelection()
+    for row in (0, 7, 8):
+        wList.listBox.selectionModel().select(wList._model.index(row), QItemSelectionModel.Select)
+    wList._doDelete()
+    assert wList._model.stringList() == [
+        "word_a", "word_b", "word_c", "word_d", "word_f", "word_g"
+    ]
 
     # Import/Export
     # =============
@@ -128,7 +146,7 @@ def testDlgWordList_Dialog(qtbot, monkeypatch, nwGUI, fncPath, projPath):
         mp.setattr(QFileDialog, "getSaveFileName", lambda *a, **k: (str(expFile), ""))
         wList.exportButton.click()
         assert expFile.exists()
-        assert expFile.read_text() == "word_a\nword_b\nword_c\nword_d\nword_f\nword_g"
+        assert expFile.read_text() == "word_a\nword_b\nword_c\nword_d\nword_f\nword_g\n"
 
     # Write File
     impFile.write_text("word_d\nword_e\nword_f\tword_g word_h word_i\n\n\n")
@@ -138,18 +156,36 @@ def testDlgWordList_Dialog(qtbot, monkeypatch, nwGUI, fncPath, projPath):
         mp.setattr(QFileDialog, "getOpenFileName", lambda *a, **k: (str(impFile), ""))
         mp.setattr("builtins.open", causeOSError)
         wList.importButton.click()
-        assert wList.listBox.count() == 6
+        assert wList._model.rowCount() == 6
 
     # Import File, OK
     with monkeypatch.context() as mp:
         mp.setattr(QFileDialog, "getOpenFileName", lambda *a, **k: (str(impFile), ""))
         wList.importButton.click()
-        assert wList.listBox.count() == 9
+        assert wList._model.rowCount() == 9
+
+    # Import File, UTF-8
+    impFile.write_text("word_a caf\u00e9\n", encoding="utf-8")
+    with monkeypatch.context() as mp:
+        mp.setattr(QFileDialog, "getOpenFileName", lambda *a, **k: (str(impFile), ""))
+        wList.importButton.click()
+        assert wList._model.rowCount() == 10
+        assert "caf\u00e9" in wList._model.stringList()
+
+    # Import File, Invalid UTF-8
+    impFile.write_bytes(b"word_x \xff\xfe word_y\n")
+    before = wList._model.stringList()
+    SHARED._lastAlert = ""
+    with monkeypatch.context() as mp:
+        mp.setattr(QFileDialog, "getOpenFileName", lambda *a, **k: (str(impFile), ""))
+        wList.importButton.click()
+        assert "Could not read file." in SHARED.lastAlert
+        assert wList._model.stringList() == before
 
     # Save and Check List
     wList._doSave()
     userDict.load()
-    assert len(list(userDict)) == 9
+    assert len(list(userDict)) == 10
     assert "word_a" in userDict
     assert "word_b" in userDict
     assert "word_c" in userDict
@@ -159,6 +195,7 @@ def testDlgWordList_Dialog(qtbot, monkeypatch, nwGUI, fncPath, projPath):
     assert "word_g" in userDict
     assert "word_h" in userDict
     assert "word_i" in userDict
+    assert "caf\u00e9" in userDict
 
     # qtbot.stop()
 